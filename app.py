@@ -1,26 +1,36 @@
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, Response, request, send_from_directory
 from flask_cors import CORS
+from whitenoise import WhiteNoise
+import orjson
 import os
 import base64
 import json
+import queue
+from collections import Counter, deque
 from datetime import datetime
+import threading
 import uuid
 
 app = Flask(__name__)
-CORS(app, origins=[
+ALLOWED_ORIGINS = [
     "http://localhost:3000",  # for local React dev
     "https://swarm-frontend-lm2avzxm7-varshinis-projects-50d32d39.vercel.app",
-    "https://swarm-frontend-indol.vercel.app/",
+    "https://swarm-frontend-indol.vercel.app",
     "https://swarm-frontend-xgsc.onrender.com"  # your deployed React frontend
-])
-# Student database with valid roll numbers
-VALID_ROLL_NUMBERS = set()
+]
+CORS(app, origins=ALLOWED_ORIGINS)
 
-# Generate roll numbers from 201-269 and 431-436
-for roll in range(201, 270):  # 201-269
-    VALID_ROLL_NUMBERS.add(str(roll))
-for roll in range(431, 437):  # 431-436
-    VALID_ROLL_NUMBERS.add(str(roll))
+# Static headers for short-circuited CORS preflights
+PREFLIGHT_ORIGINS = frozenset(ALLOWED_ORIGINS)
+PREFLIGHT_HEADERS = {
+    'Access-Control-Allow-Methods': 'GET,POST,OPTIONS',
+    'Access-Control-Allow-Headers': 'Content-Type',
+    'Access-Control-Max-Age': '86400',
+    'Vary': 'Origin'
+}
+
+# Most recent contribution log entries kept in memory
+CONTRIBUTION_LOG_SIZE = 1000
 
 # In-memory storage
 game_data = {
@@ -30,9 +40,18 @@ game_data = {
     'revealed': False,
     'current_game': None,
     'players': {},
+    'roll_index': {},
+    'next_node_seq': 0,
     'guesses': [],
+    'guessed_node_ids': set(),
+    'vote_counts': Counter(),
+    'correct_count': 0,
     'swarm_results': {},
-    'contribution_log': []
+    'results_view': None,
+    'contribution_log': deque(maxlen=CONTRIBUTION_LOG_SIZE),
+    '_block_seq': 0,
+    '_dashboard_cache': None,
+    '_detailed_cache': None
 }
 
 # Simple admin credentials
@@ -41,43 +60,185 @@ ADMIN_CREDENTIALS = {
     'password': 'swarm123'
 }
 
+# Uploaded game images
+UPLOADS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'uploads')
+os.makedirs(UPLOADS_DIR, exist_ok=True)
+
+# Serve uploaded images on disk from WSGI middleware
+uploads_middleware = WhiteNoise(app.wsgi_app, root=UPLOADS_DIR, prefix='uploads/', max_age=3600)
+app.wsgi_app = uploads_middleware
+
+# Small images uploaded by this process are served straight from memory
+IMAGE_CACHE_MAX_BYTES = 2 * 1024 * 1024
+IMAGE_CACHE_SIZE = 8
+_image_cache = {}
+
+AVATARS = ['🐝', '🤖', '🦾', '🐞', '🦋', '🕷️']
+
+_node_lock = threading.Lock()
+_state_lock = threading.RLock()
+
+# Contribution log entries are appended by a background writer
+LOG_BATCH_SIZE = 64
+_log_queue = queue.Queue()
+
+# Guesses and options come from clients, so confidence dicts may have non-string keys
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+def ojsonify(payload, status=200):
+    """Serialize payload with orjson and wrap it in a JSON response.
+
+    Timestamps are stored as datetime objects and formatted to ISO 8601 by orjson.
+    """
+    return app.response_class(orjson.dumps(payload, option=ORJSON_OPTIONS), status=status, mimetype='application/json')
+
+def cached_json_response(body):
+    """Wrap pre-serialized JSON bytes in a response"""
+    return app.response_class(body, mimetype='application/json')
+
+def invalidate_results_cache():
+    """Drop the serialized dashboard and detailed results payloads; caller must hold _state_lock"""
+    game_data['_dashboard_cache'] = None
+    game_data['_detailed_cache'] = None
+
+def is_valid_roll_number(roll_number):
+    """Check roll number against the student ranges 201-269 and 431-436"""
+    # Valid roll numbers are exactly three ASCII digits, which also rejects leading zeros
+    if len(roll_number) != 3 or not roll_number.isascii() or not roll_number.isdigit():
+        return False
+    n = int(roll_number)
+    return 201 <= n < 270 or 431 <= n < 437
+
 def generate_node_id():
-    """Generate unique node ID"""
-    node_count = len(game_data['players'])
-    return f"Node_{str(node_count + 1).zfill(2)}"
+    """Generate unique node ID and its sequence number"""
+    with _node_lock:
+        game_data['next_node_seq'] += 1
+        n = game_data['next_node_seq']
+    return f"Node_{n:02d}", n
 
-def calculate_swarm_confidence(guesses):
-    """Calculate swarm confidence from guesses"""
-    if not guesses:
+def calculate_swarm_confidence(vote_counts):
+    """Calculate swarm confidence from a Counter of votes per option"""
+    total_votes = vote_counts.total()
+    if not total_votes:
         return {}
     
-    vote_counts = {}
-    for guess in guesses:
-        option = guess['guess']
-        vote_counts[option] = vote_counts.get(option, 0) + 1
-    
-    total_votes = sum(vote_counts.values())
-    confidence = {}
-    
-    for option, votes in vote_counts.items():
-        confidence[option] = round((votes / total_votes) * 100, 1)
-    
-    return confidence
+    return {option: round(votes * 100 / total_votes, 1) for option, votes in vote_counts.items()}
+
+def build_results_view():
+    """Join each guess with its player's details and correctness"""
+    # end_game can run before any game is created or after a reset
+    if game_data['current_game'] is None:
+        return []
+    
+    players = game_data['players']
+    correct_answer = game_data['current_game']['correct_answer']
+    return [{
+        'node_id': guess['node_id'],
+        'player_name': players[guess['node_id']]['name'],
+        'roll_number': players[guess['node_id']]['roll_number'],
+        'guess': guess['guess'],
+        'correct': guess['guess'] == correct_answer
+    } for guess in game_data['guesses']]
+
+def get_results_view():
+    """Return the denormalized results, rebuilding if guesses changed since end_game"""
+    with _state_lock:
+        if game_data['results_view'] is None:
+            game_data['results_view'] = build_results_view()
+        return game_data['results_view']
 
-def log_contribution(node_id, action, impact=""):
-    """Log blockchain-style contribution"""
-    log_entry = {
-        'block_id': len(game_data['contribution_log']) + 1,
+def log_contribution(node_id, action, impact="", ts=None):
+    """Queue blockchain-style contribution, reusing the caller's timestamp if given"""
+    if ts is None:
+        ts = datetime.now()
+    _log_queue.put_nowait({
         'node_id': node_id,
         'action': action,
-        'timestamp': datetime.now().isoformat(),
+        'timestamp': ts,
         'impact': impact
+    })
+
+def append_contributions(entries):
+    """Append queued contributions to the log, assigning block IDs in order"""
+    with _state_lock:
+        for entry in entries:
+            game_data['_block_seq'] += 1
+            game_data['contribution_log'].append({'block_id': game_data['_block_seq'], **entry})
+        invalidate_results_cache()
+
+def contribution_log_writer():
+    """Drain the log queue in batches so request handlers never append directly"""
+    while True:
+        entries = [_log_queue.get()]
+        while len(entries) < LOG_BATCH_SIZE:
+            try:
+                entries.append(_log_queue.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            append_contributions(entries)
+        except Exception:
+            # The log is best-effort; keep the writer alive so flushes never hang
+            app.logger.exception("Failed to append %d contribution log entries", len(entries))
+        finally:
+            for _ in entries:
+                _log_queue.task_done()
+
+def flush_contribution_log():
+    """Wait until every queued contribution is in the log; must not hold _state_lock"""
+    _log_queue.join()
+
+threading.Thread(target=contribution_log_writer, name='contribution-log-writer', daemon=True).start()
+
+def record_guess(node_id, guess):
+    """Validate and record a single guess; caller must hold _state_lock"""
+    if not node_id or not guess:
+        return False, 'Node ID and guess required'
+    
+    # Guesses are counted by value, so only JSON scalars are accepted
+    if not isinstance(guess, (str, int, float)):
+        return False, 'Invalid guess'
+    
+    if node_id not in game_data['players']:
+        return False, 'Invalid node ID'
+    
+    # Check if already submitted
+    if node_id in game_data['guessed_node_ids']:
+        return False, 'Already submitted'
+    
+    # Record guess
+    ts = datetime.now()
+    guess_entry = {
+        'node_id': node_id,
+        'guess': guess,
+        'timestamp': ts
     }
-    game_data['contribution_log'].append(log_entry)
+    game_data['guesses'].append(guess_entry)
+    game_data['guessed_node_ids'].add(node_id)
+    game_data['results_view'] = None
+    invalidate_results_cache()
+    game_data['vote_counts'][guess] += 1
+    if guess == game_data['current_game']['correct_answer']:
+        game_data['correct_count'] += 1
+    
+    log_contribution(node_id, f"Submitted guess: {guess}", "Contribution added to swarm", ts=ts)
+    
+    return True, 'Guess submitted successfully'
+
+@app.before_request
+def short_circuit_preflight():
+    """Answer CORS preflights from known origins without route dispatch"""
+    # Unknown paths still fall through to a 404 via normal dispatch
+    if request.method != 'OPTIONS' or request.url_rule is None:
+        return None
+    origin = request.headers.get('Origin')
+    if origin not in PREFLIGHT_ORIGINS:
+        return None
+    return Response(b'', status=204, headers={'Access-Control-Allow-Origin': origin, **PREFLIGHT_HEADERS})
 
 @app.route('/')
 def home():
-    return jsonify({"message": "Swarm Vision backend is running successfully!"}), 200
+    return ojsonify({"message": "Swarm Vision backend is running successfully!"})
 
 @app.route('/admin/login', methods=['POST'])
 def admin_login():
@@ -87,117 +248,132 @@ def admin_login():
     
     if username == ADMIN_CREDENTIALS['username'] and password == ADMIN_CREDENTIALS['password']:
         game_data['admin_logged_in'] = True
-        return jsonify({'success': True, 'message': 'Admin logged in successfully'})
+        return ojsonify({'success': True, 'message': 'Admin logged in successfully'})
     
-    return jsonify({'success': False, 'message': 'Invalid credentials'}), 401
+    return ojsonify({'success': False, 'message': 'Invalid credentials'}, status=401)
 
 @app.route('/admin/create_game', methods=['POST'])
 def create_game():
     if not game_data['admin_logged_in']:
-        return jsonify({'success': False, 'message': 'Admin not logged in'}), 401
+        return ojsonify({'success': False, 'message': 'Admin not logged in'}, status=401)
     
     data = request.get_json()
     
-    # Create uploads directory if it doesn't exist
-    uploads_dir = os.path.join(os.path.dirname(__file__), 'uploads')
-    os.makedirs(uploads_dir, exist_ok=True)
-    
     # Handle image upload (base64 for simplicity)
     image_data = data.get('image')
     if image_data:
         # Remove data URL prefix if present
-        if ',' in image_data:
-            image_data = image_data.split(',')[1]
+        image_data = image_data.partition(',')[2] or image_data
         
         # Save image
         image_filename = f"game_image_{uuid.uuid4().hex[:8]}.png"
-        image_path = os.path.join(uploads_dir, image_filename)
+        image_path = os.path.join(UPLOADS_DIR, image_filename)
+        
+        decoded_bytes = base64.b64decode(image_data, validate=False)
+        image_bytes = memoryview(decoded_bytes)
+        fd = os.open(image_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            while image_bytes:
+                image_bytes = image_bytes[os.write(fd, image_bytes):]
+        finally:
+            os.close(fd)
         
-        with open(image_path, 'wb') as f:
-            f.write(base64.b64decode(image_data))
+        if len(decoded_bytes) <= IMAGE_CACHE_MAX_BYTES:
+            with _state_lock:
+                if len(_image_cache) >= IMAGE_CACHE_SIZE:
+                    # Evict the oldest upload
+                    _image_cache.pop(next(iter(_image_cache)))
+                _image_cache[image_filename] = decoded_bytes
+        else:
+            # WhiteNoise only indexes files it has scanned, so register just the new image
+            # (a directory rescan would also shadow the in-memory cached images)
+            uploads_middleware.add_file_to_dictionary('/uploads/' + image_filename, image_path, stat_cache=None)
     else:
         # Use placeholder image
         image_filename = "placeholder.png"
     
-    game_data['current_game'] = {
-        'id': str(uuid.uuid4()),
-        'image': image_filename,
-        'options': data.get('options', []),
-        'correct_answer': data.get('correct_answer'),
-        'created_at': datetime.now().isoformat()
-    }
-    
-    # Reset game state
-    game_data['guesses'] = []
-    game_data['swarm_results'] = {}
-    game_data['game_ended'] = False
-    game_data['revealed'] = False
-    
-    log_contribution("ADMIN", "Created new game", "Game initialized")
-    
-    return jsonify({'success': True, 'message': 'Game created successfully'})
+    ts = datetime.now()
+    with _state_lock:
+        game_data['current_game'] = {
+            'id': str(uuid.uuid4()),
+            'image': image_filename,
+            'options': data.get('options', []),
+            'correct_answer': data.get('correct_answer'),
+            'created_at': ts
+        }
+        
+        # Reset game state
+        game_data['guesses'] = []
+        game_data['guessed_node_ids'] = set()
+        game_data['vote_counts'] = Counter()
+        game_data['correct_count'] = 0
+        game_data['swarm_results'] = {}
+        game_data['results_view'] = None
+        game_data['game_ended'] = False
+        game_data['revealed'] = False
+        invalidate_results_cache()
+    
+    log_contribution("ADMIN", "Created new game", "Game initialized", ts=ts)
+    
+    return ojsonify({'success': True, 'message': 'Game created successfully'})
 
 @app.route('/start_game', methods=['POST'])
 def start_game():
     if not game_data['admin_logged_in']:
-        return jsonify({'success': False, 'message': 'Admin not logged in'}), 401
+        return ojsonify({'success': False, 'message': 'Admin not logged in'}, status=401)
     
     if not game_data['current_game']:
-        return jsonify({'success': False, 'message': 'No game created'}), 400
+        return ojsonify({'success': False, 'message': 'No game created'}, status=400)
     
-    game_data['game_active'] = True
+    with _state_lock:
+        game_data['game_active'] = True
     log_contribution("ADMIN", "Started game", "Game is now live")
     
-    return jsonify({'success': True, 'message': 'Game started'})
+    return ojsonify({'success': True, 'message': 'Game started'})
 
 @app.route('/end_game', methods=['POST'])
 def end_game():
     if not game_data['admin_logged_in']:
-        return jsonify({'success': False, 'message': 'Admin not logged in'}), 401
-    
-    game_data['game_active'] = False
-    game_data['game_ended'] = True
+        return ojsonify({'success': False, 'message': 'Admin not logged in'}, status=401)
     
-    # Calculate final swarm results
-    if game_data['guesses']:
-        game_data['swarm_results'] = calculate_swarm_confidence(game_data['guesses'])
+    with _state_lock:
+        game_data['game_active'] = False
+        game_data['game_ended'] = True
+        
+        # Calculate final swarm results
+        if game_data['guesses']:
+            game_data['swarm_results'] = calculate_swarm_confidence(game_data['vote_counts'])
+        
+        # Denormalize guesses with player details once for the results endpoints
+        game_data['results_view'] = build_results_view()
+        invalidate_results_cache()
     
     log_contribution("ADMIN", "Ended game", "Game ended, ready for reveal")
     
-    return jsonify({'success': True, 'message': 'Game ended'})
+    return ojsonify({'success': True, 'message': 'Game ended'})
 
 @app.route('/reveal_answer', methods=['POST'])
 def reveal_answer():
     if not game_data['admin_logged_in']:
-        return jsonify({'success': False, 'message': 'Admin not logged in'}), 401
+        return ojsonify({'success': False, 'message': 'Admin not logged in'}, status=401)
     
     if not game_data['game_ended']:
-        return jsonify({'success': False, 'message': 'Game not ended yet'}), 400
+        return ojsonify({'success': False, 'message': 'Game not ended yet'}, status=400)
     
     # Calculate individual results
-    individual_results = []
-    for guess in game_data['guesses']:
-        is_correct = guess['guess'] == game_data['current_game']['correct_answer']
-        player_data = game_data['players'][guess['node_id']]
-        individual_results.append({
-            'node_id': guess['node_id'],
-            'player_name': player_data['name'],
-            'roll_number': player_data['roll_number'],
-            'guess': guess['guess'],
-            'correct': is_correct
-        })
+    individual_results = get_results_view()
     
     # Calculate swarm accuracy
-    correct_guesses = sum(1 for g in game_data['guesses'] 
-                         if g['guess'] == game_data['current_game']['correct_answer'])
+    correct_guesses = game_data['correct_count']
     swarm_accuracy = (correct_guesses / len(game_data['guesses']) * 100) if game_data['guesses'] else 0
     
     log_contribution("ADMIN", "Revealed answer", "Results and correct answer shown")
     
     # Mark as revealed
-    game_data['revealed'] = True
+    with _state_lock:
+        game_data['revealed'] = True
     
-    return jsonify({
+    return ojsonify({
         'success': True,
         'individual_results': individual_results,
         'swarm_accuracy': round(swarm_accuracy, 1),
@@ -213,32 +389,34 @@ def join_game():
     roll_number = data.get('roll_number', '').strip()
     
     if not name:
-        return jsonify({'success': False, 'message': 'Name is required'}), 400
+        return ojsonify({'success': False, 'message': 'Name is required'}, status=400)
     
     if not roll_number:
-        return jsonify({'success': False, 'message': 'Roll number is required'}), 400
+        return ojsonify({'success': False, 'message': 'Roll number is required'}, status=400)
     
     # Validate roll number
-    if roll_number not in VALID_ROLL_NUMBERS:
-        return jsonify({'success': False, 'message': 'Invalid roll number. Please enter a valid roll number (211-269 or 431-436)'}), 400
-    
-    # Check if roll number is already used
-    for player_data in game_data['players'].values():
-        if player_data.get('roll_number') == roll_number:
-            return jsonify({'success': False, 'message': 'Roll number already in use'}), 400
-    
-    # Generate unique node ID
-    node_id = generate_node_id()
-    game_data['players'][node_id] = {
-        'name': name,
-        'roll_number': roll_number,
-        'joined_at': datetime.now().isoformat(),
-        'avatar': ['🐝', '🤖', '🦾', '🐞', '🦋', '🕷️'][len(game_data['players']) % 6]
-    }
+    if not is_valid_roll_number(roll_number):
+        return ojsonify({'success': False, 'message': 'Invalid roll number. Please enter a valid roll number (211-269 or 431-436)'}, status=400)
     
-    log_contribution(node_id, f"Joined as {name} (Roll: {roll_number})", "New node added to swarm")
-    
-    return jsonify({
+    with _state_lock:
+        # Check if roll number is already used
+        if roll_number in game_data['roll_index']:
+            return ojsonify({'success': False, 'message': 'Roll number already in use'}, status=400)
+        
+        # Generate unique node ID
+        node_id, node_seq = generate_node_id()
+        ts = datetime.now()
+        game_data['players'][node_id] = {
+            'name': name,
+            'roll_number': roll_number,
+            'joined_at': ts,
+            'avatar': AVATARS[(node_seq - 1) % len(AVATARS)]
+        }
+        game_data['roll_index'][roll_number] = node_id
+    
+    log_contribution(node_id, f"Joined as {name} (Roll: {roll_number})", "New node added to swarm", ts=ts)
+    
+    return ojsonify({
         'success': True, 
         'node_id': node_id,
         'roll_number': roll_number,
@@ -252,64 +430,83 @@ def submit_guess():
     guess = data.get('guess')
     
     if not game_data['game_active']:
-        return jsonify({'success': False, 'message': 'Game not active'}), 400
+        return ojsonify({'success': False, 'message': 'Game not active'}, status=400)
     
-    if not node_id or not guess:
-        return jsonify({'success': False, 'message': 'Node ID and guess required'}), 400
-    
-    if node_id not in game_data['players']:
-        return jsonify({'success': False, 'message': 'Invalid node ID'}), 400
-    
-    # Check if already submitted
-    existing_guess = next((g for g in game_data['guesses'] if g['node_id'] == node_id), None)
-    if existing_guess:
-        return jsonify({'success': False, 'message': 'Already submitted'}), 400
-    
-    # Record guess
-    guess_entry = {
-        'node_id': node_id,
-        'guess': guess,
-        'timestamp': datetime.now().isoformat()
-    }
-    game_data['guesses'].append(guess_entry)
+    with _state_lock:
+        ok, message = record_guess(node_id, guess)
+        if not ok:
+            return ojsonify({'success': False, 'message': message}, status=400)
+        
+        # Calculate current swarm confidence
+        current_confidence = calculate_swarm_confidence(game_data['vote_counts'])
+        total_guesses = len(game_data['guesses'])
     
-    # Calculate current swarm confidence
-    current_confidence = calculate_swarm_confidence(game_data['guesses'])
+    return ojsonify({
+        'success': True,
+        'message': message,
+        'swarm_confidence': current_confidence,
+        'total_guesses': total_guesses
+    })
+
+@app.route('/submit_guesses_bulk', methods=['POST'])
+def submit_guesses_bulk():
+    data = request.get_json()
+    entries = data.get('guesses')
     
-    log_contribution(node_id, f"Submitted guess: {guess}", "Contribution added to swarm")
+    if not game_data['game_active']:
+        return ojsonify({'success': False, 'message': 'Game not active'}, status=400)
+    
+    if not isinstance(entries, list):
+        return ojsonify({'success': False, 'message': 'List of guesses required'}, status=400)
+    
+    results = []
+    with _state_lock:
+        for entry in entries:
+            node_id = entry.get('node_id') if isinstance(entry, dict) else None
+            guess = entry.get('guess') if isinstance(entry, dict) else None
+            ok, message = record_guess(node_id, guess)
+            results.append({'node_id': node_id, 'success': ok, 'message': message})
+        
+        # Calculate current swarm confidence once for the whole batch
+        current_confidence = calculate_swarm_confidence(game_data['vote_counts'])
+        total_guesses = len(game_data['guesses'])
     
-    return jsonify({
+    return ojsonify({
         'success': True,
-        'message': 'Guess submitted successfully',
+        'results': results,
         'swarm_confidence': current_confidence,
-        'total_guesses': len(game_data['guesses'])
+        'total_guesses': total_guesses
     })
 
 @app.route('/get_game_status', methods=['GET'])
 def get_game_status():
-    return jsonify({
+    # Hottest polling endpoint: build a minimal response with a known length
+    body = orjson.dumps({
         'game_active': game_data['game_active'],
         'game_ended': game_data['game_ended'],
         'current_game': game_data['current_game'],
         'total_players': len(game_data['players']),
         'total_guesses': len(game_data['guesses'])
+    }, option=ORJSON_OPTIONS)
+    return Response(body, status=200, headers={
+        'Content-Type': 'application/json',
+        'Content-Length': str(len(body))
     })
 
 @app.route('/get_swarm_results', methods=['GET'])
 def get_swarm_results():
     if not game_data['game_ended']:
-        return jsonify({'success': False, 'message': 'Game not ended'}), 400
+        return ojsonify({'success': False, 'message': 'Game not ended'}, status=400)
     
     if not game_data.get('revealed', False):
-        return jsonify({'success': False, 'message': 'Answer not revealed yet'}), 400
+        return ojsonify({'success': False, 'message': 'Answer not revealed yet'}, status=400)
     
     # Calculate swarm accuracy
-    correct_guesses = sum(1 for g in game_data['guesses'] 
-                         if g['guess'] == game_data['current_game']['correct_answer'])
+    correct_guesses = game_data['correct_count']
     swarm_accuracy = (correct_guesses / len(game_data['guesses']) * 100) if game_data['guesses'] else 0
     
     # Return only basic swarm information for students
-    return jsonify({
+    return ojsonify({
         'success': True,
         'swarm_confidence': game_data['swarm_results'],
         'swarm_accuracy': round(swarm_accuracy, 1),
@@ -320,98 +517,111 @@ def get_swarm_results():
 @app.route('/admin/get_detailed_results', methods=['GET'])
 def get_detailed_results():
     if not game_data['admin_logged_in']:
-        return jsonify({'success': False, 'message': 'Admin not logged in'}), 401
+        return ojsonify({'success': False, 'message': 'Admin not logged in'}, status=401)
     
     if not game_data['game_ended']:
-        return jsonify({'success': False, 'message': 'Game not ended'}), 400
+        return ojsonify({'success': False, 'message': 'Game not ended'}, status=400)
     
     if not game_data.get('revealed', False):
-        return jsonify({'success': False, 'message': 'Answer not revealed yet'}), 400
-    
-    # Calculate individual results for admin only
-    individual_results = []
-    for guess in game_data['guesses']:
-        is_correct = guess['guess'] == game_data['current_game']['correct_answer']
-        player_data = game_data['players'][guess['node_id']]
-        individual_results.append({
-            'node_id': guess['node_id'],
-            'player_name': player_data['name'],
-            'roll_number': player_data['roll_number'],
-            'guess': guess['guess'],
-            'correct': is_correct
-        })
+        return ojsonify({'success': False, 'message': 'Answer not revealed yet'}, status=400)
     
-    # Calculate swarm accuracy
-    correct_guesses = sum(1 for g in game_data['guesses'] 
-                         if g['guess'] == game_data['current_game']['correct_answer'])
-    swarm_accuracy = (correct_guesses / len(game_data['guesses']) * 100) if game_data['guesses'] else 0
+    if game_data['_detailed_cache'] is not None:
+        return cached_json_response(game_data['_detailed_cache'])
     
-    return jsonify({
-        'success': True,
-        'swarm_confidence': game_data['swarm_results'],
-        'individual_results': individual_results,
-        'swarm_accuracy': round(swarm_accuracy, 1),
-        'correct_answer': game_data['current_game']['correct_answer'],
-        'total_participants': len(game_data['guesses'])
-    })
+    with _state_lock:
+        # Calculate individual results for admin only
+        individual_results = get_results_view()
+        
+        # Calculate swarm accuracy
+        correct_guesses = game_data['correct_count']
+        swarm_accuracy = (correct_guesses / len(game_data['guesses']) * 100) if game_data['guesses'] else 0
+        
+        body = orjson.dumps({
+            'success': True,
+            'swarm_confidence': game_data['swarm_results'],
+            'individual_results': individual_results,
+            'swarm_accuracy': round(swarm_accuracy, 1),
+            'correct_answer': game_data['current_game']['correct_answer'],
+            'total_participants': len(game_data['guesses'])
+        }, option=ORJSON_OPTIONS)
+        game_data['_detailed_cache'] = body
+    
+    return cached_json_response(body)
 
 @app.route('/get_dashboard', methods=['GET'])
 def get_dashboard():
     if not game_data['game_ended']:
-        return jsonify({'success': False, 'message': 'Game not ended'}), 400
-    
-    # Calculate statistics
-    total_players = len(game_data['players'])
-    total_guesses = len(game_data['guesses'])
-    
-    # Individual accuracies
-    individual_accuracies = []
-    for guess in game_data['guesses']:
-        is_correct = guess['guess'] == game_data['current_game']['correct_answer']
-        player_data = game_data['players'][guess['node_id']]
-        individual_accuracies.append({
-            'node_id': guess['node_id'],
-            'player_name': player_data['name'],
-            'roll_number': player_data['roll_number'],
-            'accuracy': 100 if is_correct else 0
-        })
+        return ojsonify({'success': False, 'message': 'Game not ended'}, status=400)
     
-    # Swarm accuracy
-    correct_guesses = sum(1 for g in game_data['guesses'] 
-                         if g['guess'] == game_data['current_game']['correct_answer'])
-    swarm_accuracy = (correct_guesses / total_guesses * 100) if total_guesses > 0 else 0
+    flush_contribution_log()
     
-    return jsonify({
-        'success': True,
-        'individual_accuracies': individual_accuracies,
-        'swarm_accuracy': round(swarm_accuracy, 1),
-        'contribution_log': game_data['contribution_log'],
-        'total_participants': total_guesses,
-        'swarm_confidence': game_data['swarm_results']
-    })
+    if game_data['_dashboard_cache'] is not None:
+        return cached_json_response(game_data['_dashboard_cache'])
+    
+    with _state_lock:
+        # Calculate statistics
+        total_players = len(game_data['players'])
+        total_guesses = len(game_data['guesses'])
+        
+        # Individual accuracies
+        individual_accuracies = [{
+            'node_id': result['node_id'],
+            'player_name': result['player_name'],
+            'roll_number': result['roll_number'],
+            'accuracy': 100 if result['correct'] else 0
+        } for result in get_results_view()]
+        
+        # Swarm accuracy
+        correct_guesses = game_data['correct_count']
+        swarm_accuracy = (correct_guesses / total_guesses * 100) if total_guesses > 0 else 0
+        
+        body = orjson.dumps({
+            'success': True,
+            'individual_accuracies': individual_accuracies,
+            'swarm_accuracy': round(swarm_accuracy, 1),
+            'contribution_log': list(game_data['contribution_log']),
+            'total_participants': total_guesses,
+            'swarm_confidence': game_data['swarm_results']
+        }, option=ORJSON_OPTIONS)
+        game_data['_dashboard_cache'] = body
+    
+    return cached_json_response(body)
 
 @app.route('/uploads/<filename>')
 def uploaded_file(filename):
-    uploads_dir = os.path.join(os.path.dirname(__file__), 'uploads')
-    return send_from_directory(uploads_dir, filename)
+    data = _image_cache.get(filename)
+    if data is not None:
+        return Response(data, mimetype='image/png', headers={'Cache-Control': 'public, max-age=3600'})
+    return send_from_directory(UPLOADS_DIR, filename)
 
 @app.route('/reset_game', methods=['POST'])
 def reset_game():
     if not game_data['admin_logged_in']:
-        return jsonify({'success': False, 'message': 'Admin not logged in'}), 401
+        return ojsonify({'success': False, 'message': 'Admin not logged in'}, status=401)
     
     # Reset all game data
-    game_data.update({
-        'game_active': False,
-        'game_ended': False,
-        'current_game': None,
-        'players': {},
-        'guesses': [],
-        'swarm_results': {},
-        'contribution_log': []
-    })
+    flush_contribution_log()
+    with _state_lock:
+        game_data.update({
+            'game_active': False,
+            'game_ended': False,
+            'current_game': None,
+            'players': {},
+            'roll_index': {},
+            'next_node_seq': 0,
+            'guesses': [],
+            'guessed_node_ids': set(),
+            'vote_counts': Counter(),
+            'correct_count': 0,
+            'swarm_results': {},
+            'results_view': None,
+            'contribution_log': deque(maxlen=CONTRIBUTION_LOG_SIZE),
+            '_block_seq': 0,
+            '_dashboard_cache': None,
+            '_detailed_cache': None
+        })
     
-    return jsonify({'success': True, 'message': 'Game reset successfully'})
+    return ojsonify({'success': True, 'message': 'Game reset successfully'})
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    app.run(debug=False, threaded=True, host='0.0.0.0', port=5000)